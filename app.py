@@ -1,33 +1,20 @@
 import json
 import difflib
-import pandas as pd
 import streamlit as st
 
-from utils import load_mapping, load_yaml_config, get_control_config
-from vertex_client import VertexAgent
-from bigquery_client import BigQueryAgent
-from systems.data_loader import fetch_system_data
-from controls.completeness import run_completeness
-from controls.accuracy import run_accuracy
-
-# ---------------- CONFIG ----------------
-PROJECT_ID = "telecom-data-lake"
-REGION = "europe-west2"
-BUCKET_NAME = None
-CONTROL_MAPPING_FILE = "config/control_mapping.yaml"
-SYSTEM_CONNECTIONS_FILE = "config/system_connections.yaml"
+import warmup
+from settings import PROJECT_ID, REGION, BUCKET_NAME, CONTROL_MAPPING_FILE
+from utils import load_mapping, get_control_config
 
 # ---------------- INIT ----------------
 st.set_page_config(page_title="Data Quality Controls", layout="wide")
-vertex_agent = VertexAgent(PROJECT_ID, REGION)
-bq_agent = BigQueryAgent(PROJECT_ID)
+# serve.py starts warm-up at container boot; this is a no-op then, and covers
+# plain `streamlit run app.py`. Clients and config are picked up on first use below.
+warmup.start(PROJECT_ID, REGION, BUCKET_NAME, CONTROL_MAPPING_FILE)
 
 st.title("🛡️ Data Quality Controls")
 st.markdown("Run data quality controls using AI-interpreted requirements.")
 
-# ---------------- LOAD CONFIG ----------------
-config_data = load_yaml_config(BUCKET_NAME, CONTROL_MAPPING_FILE)
-
 
 def reset_session():
     for key in [
@@ -61,6 +48,8 @@ def read_uploaded_requirement(uploaded_file) -> str:
 
     file_name = uploaded_file.name.lower()
 
+    import pandas as pd
+
     try:
         if file_name.endswith(".txt") or file_name.endswith(".md"):
             return uploaded_file.read().decode("utf-8")
@@ -84,6 +73,9 @@ def read_uploaded_requirement(uploaded_file) -> str:
 
 
 def load_product_list() -> list:
+    from bigquery_client import BigQueryAgent
+
+    bq_agent = BigQueryAgent(PROJECT_ID, client=warmup.bigquery_client(PROJECT_ID))
     product_df = bq_agent.execute(
         f"""
         SELECT DISTINCT product_name
@@ -94,6 +86,28 @@ def load_product_list() -> list:
     return sorted(product_df["product_name"].astype(str).tolist())
 
 
+def fetch_control_data(systems: list, product_name: str) -> dict:
+    from systems.data_loader import fetch_system_data
+
+    return fetch_system_data(
+        PROJECT_ID,
+        systems,
+        client=warmup.bigquery_client(PROJECT_ID),
+        product_name=product_name,
+    )
+
+
+def execute_control(control_type: str, system_dfs: dict, product_name: str):
+    from controls.completeness import run_completeness
+    from controls.accuracy import run_accuracy
+
+    if control_type == "Completeness":
+        return run_completeness(system_dfs, product_name)
+    if control_type == "Accuracy":
+        return run_accuracy(system_dfs, product_name)
+    raise ValueError(f"Unsupported control type: {control_type}")
+
+
 def resolve_product_name(ai_product: str, product_list: list) -> str:
     if not ai_product:
         return ""
@@ -148,6 +162,7 @@ Requirement:
 {requirement_text}
 """
 
+    vertex_agent = warmup.vertex_agent(PROJECT_ID, REGION)
     response = vertex_agent.model.generate_content(prompt)
     raw_text = response.text.strip()
 
@@ -270,6 +285,7 @@ with st.expander("View AI-extracted details", expanded=True):
 
 # ---------------- LOAD CONFIG ----------------
 try:
+    config_data = warmup.control_config(BUCKET_NAME, CONTROL_MAPPING_FILE)
     control_config = get_control_config(control_type, selected_product, config_data)
 except Exception as e:
     st.error(f"Unable to load configuration: {str(e)}")
@@ -317,19 +333,14 @@ if "confirmed" not in st.session_state:
 st.success(f"🚀 Running {control_type} for **{selected_product}**...")
 
 try:
-    system_dfs = fetch_system_data(PROJECT_ID, systems)
+    system_dfs = fetch_control_data(systems, selected_product)
 except Exception as e:
     st.error(f"Failed to fetch source system data: {str(e)}")
     st.stop()
 
 # ---------------- EXECUTE CONTROL ----------------
 try:
-    if control_type == "Completeness":
-        merged, result_df = run_completeness(system_dfs, selected_product)
-    elif control_type == "Accuracy":
-        merged, result_df = run_accuracy(system_dfs, selected_product)
-    else:
-        raise ValueError(f"Unsupported control type: {control_type}")
+    merged, result_df = execute_control(control_type, system_dfs, selected_product)
 except Exception as e:
     st.error(f"Control execution failed: {str(e)}")
     st.stop()
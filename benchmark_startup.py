@@ -0,0 +1,108 @@
+"""
+Startup benchmark for the Cloud Run container.
+
+Times the work app.py does before its first render, for the original startup path
+(top-level imports of pandas/vertexai/google-cloud, client construction and config
+load) and for the current one (streamlit import plus warmup.start()). Each run uses
+a fresh interpreter so nothing is already imported; the median is reported.
+
+"current" stops timing when warmup.start() returns. Client construction still
+happens, on warm-up threads; if it hasn't finished when the user first clicks
+"Interpret" (or a failed attempt is being retried), that click waits in
+warmup.vertex_agent()/bigquery_client(). This benchmark does not measure that wait.
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--anonymous]
+
+--anonymous builds the baseline's clients with anonymous credentials, for machines
+without Application Default Credentials. It skips the credential lookup, so the
+baseline (and therefore the measured saving) is a lower bound. The current path
+builds clients on warm-up threads, off the render path, so it needs no credentials.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+from settings import PROJECT_ID, REGION, CONTROL_MAPPING_FILE
+
+BASELINE = """
+import json, difflib
+import pandas as pd
+import streamlit as st
+import yaml
+from google.cloud import bigquery, storage
+import vertexai
+from vertexai.generative_models import GenerativeModel
+import controls.completeness, controls.accuracy
+from google.auth.credentials import AnonymousCredentials
+credentials = AnonymousCredentials() if {anonymous} else None
+vertexai.init(project={project!r}, location={region!r}, credentials=credentials)
+GenerativeModel("gemini-2.5-flash")
+bigquery.Client(project={project!r}, credentials=credentials)
+with open({config!r}) as f:
+    yaml.safe_load(f)
+"""
+
+CURRENT = """
+import json, difflib
+import streamlit as st
+import warmup
+from settings import PROJECT_ID, REGION, BUCKET_NAME, CONTROL_MAPPING_FILE
+from utils import load_mapping, get_control_config
+warmup.start(PROJECT_ID, REGION, BUCKET_NAME, CONTROL_MAPPING_FILE)
+"""
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def time_path(code: str) -> float:
+    proc = subprocess.run(
+        [sys.executable, "-c", TIMER.format(code=code)],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip())
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--anonymous", action="store_true")
+    args = parser.parse_args()
+
+    paths = {
+        "baseline (before first render)": BASELINE.format(
+            project=PROJECT_ID, region=REGION, config=CONTROL_MAPPING_FILE, anonymous=args.anonymous
+        ),
+        "current (before first render)": CURRENT,
+    }
+
+    medians = {}
+    print(f"{'path':<34}{'median (s)':>12}{'min (s)':>12}")
+    for name, code in paths.items():
+        try:
+            timings = [time_path(code) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{name:<34}{'failed':>12}\n{e}")
+            continue
+        medians[name] = statistics.median(timings)
+        print(f"{name:<34}{medians[name]:>12.3f}{min(timings):>12.3f}")
+
+    if len(medians) == 2:
+        baseline, current = medians.values()
+        print(
+            f"\ntime-to-first-render saving: {baseline - current:.3f}s "
+            f"({1 - current / baseline:.0%} faster; current is {current / baseline:.0%} of baseline)"
+        )
+
+
+if __name__ == "__main__":
+    main()
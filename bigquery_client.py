@@ -1,14 +1,181 @@
-from google.cloud import bigquery
 import pandas as pd
 
+MIB = 1024 ** 2
+GIB = 1024 ** 3
+
+# Planner thresholds (estimated bytes from a dry run)
+FULL_FETCH_MAX_BYTES = 1 * GIB
+PROJECTED_FETCH_MAX_BYTES = 10 * GIB
+RUN_BYTE_BUDGET = 50 * GIB
+# BigQuery bills at least 10 MB per table referenced by a query
+MIN_BYTES_BILLED = 10 * MIB
+
+_PARAMETER_TYPES = {bool: "BOOL", int: "INT64", float: "FLOAT64", str: "STRING"}
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a query would push the run past its byte budget."""
+
+
+def make_job_config(base=None, query_parameters=None, **properties):
+    """
+    Build a QueryJobConfig from a copy of `base` (the caller's config is never mutated),
+    then apply named scalar query parameters and any job config properties.
+    """
+    from google.cloud import bigquery
+
+    if base is not None:
+        config = bigquery.QueryJobConfig.from_api_repr(base.to_api_repr())
+    else:
+        config = bigquery.QueryJobConfig()
+
+    if query_parameters:
+        config.query_parameters = list(config.query_parameters) + [
+            bigquery.ScalarQueryParameter(name, _PARAMETER_TYPES.get(type(value), "STRING"), value)
+            for name, value in query_parameters.items()
+        ]
+
+    for name, value in properties.items():
+        setattr(config, name, value)
+    return config
+
+
 class BigQueryAgent:
-    def __init__(self, project_id: str):
-        self.client = bigquery.Client(project=project_id)
+    def __init__(
+        self,
+        project_id: str,
+        client=None,
+        run_byte_budget: int = RUN_BYTE_BUDGET,
+        full_fetch_max_bytes: int = FULL_FETCH_MAX_BYTES,
+        projected_fetch_max_bytes: int = PROJECTED_FETCH_MAX_BYTES,
+        job_config_factory=make_job_config,
+    ):
+        if client is None:
+            from google.cloud import bigquery
+            client = bigquery.Client(project=project_id)
+        self.client = client
+        self.run_byte_budget = run_byte_budget
+        self.full_fetch_max_bytes = full_fetch_max_bytes
+        self.projected_fetch_max_bytes = projected_fetch_max_bytes
+        self.job_config_factory = job_config_factory
+        self.bytes_billed = 0
+        self.query_log = []
+
+    @property
+    def remaining_budget(self) -> int:
+        return max(self.run_byte_budget - self.bytes_billed, 0)
+
+    def dry_run(self, query: str, job_config=None, query_parameters=None) -> int:
+        """Return the bytes BigQuery estimates the query would scan."""
+        config = self.job_config_factory(
+            job_config, query_parameters, dry_run=True, use_query_cache=False
+        )
+        job = self.client.query(query, job_config=config)
+        return job.total_bytes_processed or 0
+
+    def plan(self, table: str, columns=None, filters=None) -> dict:
+        """
+        Choose how to execute a fetch based on dry-run estimates. Every strategy
+        yields the same rows and columns; only where the work happens changes:
+        - full: SELECT *, only considered when no columns are requested
+        - projected: SELECT <columns + filter columns>, filtered client-side. The SQL
+          doesn't depend on the filter values, so one result cache entry serves them all.
+        - pushdown: SELECT <columns> WHERE <filters>, evaluated by BigQuery
+        The cheapest candidate that fits its threshold wins, the earlier one on a tie.
+        If none fit, the cheapest is returned and _run() enforces the budget.
+        """
+        filters = filters or {}
+        select_list = ", ".join(f"`{c}`" for c in columns) if columns else "*"
+        if columns:
+            fetched = list(columns) + [c for c in filters if c not in columns]
+            candidates = [(
+                "projected",
+                f"SELECT {', '.join(f'`{c}`' for c in fetched)} FROM `{table}`",
+                None,
+                self.projected_fetch_max_bytes,
+            )]
+        else:
+            candidates = [("full", f"SELECT * FROM `{table}`", None, self.full_fetch_max_bytes)]
+        if filters:
+            where = " AND ".join(f"`{column}` = @{column}" for column in filters)
+            candidates.append((
+                "pushdown",
+                f"SELECT {select_list} FROM `{table}` WHERE {where}",
+                dict(filters),
+                self.remaining_budget,
+            ))
+
+        estimates = []
+        for strategy, query, query_parameters, limit in candidates:
+            estimated = self.dry_run(query, query_parameters=query_parameters)
+            estimates.append({
+                "strategy": strategy,
+                "query": query,
+                "query_parameters": query_parameters,
+                "estimated_bytes": estimated,
+                "fits": estimated <= limit,
+            })
+
+        fitting = [e for e in estimates if e["fits"]] or estimates
+        return min(fitting, key=lambda e: e["estimated_bytes"])
+
+    def fetch_table(self, table: str, columns=None, filters=None) -> pd.DataFrame:
+        """
+        Fetch `columns` (all if None) of the rows matching `filters` ({column: value},
+        combined with AND) using the strategy chosen by plan().
+        """
+        chosen = self.plan(table, columns=columns, filters=filters)
+        df = self._run(
+            chosen["query"],
+            chosen["estimated_bytes"],
+            chosen["strategy"],
+            query_parameters=chosen["query_parameters"],
+        )
+
+        if filters and chosen["strategy"] != "pushdown":
+            for column, value in filters.items():
+                df = df[df[column] == value]
+            df = df.reset_index(drop=True)
+        if columns:
+            df = df[list(columns)]
+        return df
 
     def execute(self, query: str) -> pd.DataFrame:
-        job = self.client.query(query)
-        return job.result().to_dataframe()
+        return self.execute_with_config(query)
 
     def execute_with_config(self, query: str, job_config=None) -> pd.DataFrame:
-        job = self.client.query(query, job_config=job_config)
-        return job.result().to_dataframe()
+        estimated = self.dry_run(query, job_config)
+        return self._run(query, estimated, "direct", job_config)
+
+    def _run(
+        self, query: str, estimated_bytes: int, strategy: str, job_config=None, query_parameters=None
+    ) -> pd.DataFrame:
+        required = max(estimated_bytes, MIN_BYTES_BILLED)
+        if required > self.remaining_budget:
+            raise QueryBudgetExceeded(
+                f"Query would bill at least {required} bytes but only "
+                f"{self.remaining_budget} of {self.run_byte_budget} remain in this run's budget."
+            )
+
+        config = self.job_config_factory(
+            job_config,
+            query_parameters,
+            # Identical fetches within a run (and across reruns) should hit the result cache.
+            use_query_cache=True,
+            # Hard stop on BigQuery's side in case the dry-run estimate was low.
+            maximum_bytes_billed=self.remaining_budget,
+        )
+
+        job = self.client.query(query, job_config=config)
+        df = job.result().to_dataframe()
+
+        billed = job.total_bytes_billed or 0
+        self.bytes_billed += billed
+        self.query_log.append({
+            "query": query,
+            "strategy": strategy,
+            "estimated_bytes": estimated_bytes,
+            "bytes_billed": billed,
+            "cache_hit": bool(job.cache_hit),
+        })
+        return df
@@ -1,5 +1,5 @@
 import json
-import pandas as pd
+from functools import lru_cache
 
 def generate_sql(prompt, siebel_mapping, antillia_mapping):
     """
@@ -10,15 +10,15 @@ def generate_sql(prompt, siebel_mapping, antillia_mapping):
     sql = f"-- SQL generated for prompt: {prompt}\nSELECT * FROM orders LIMIT 10;"
     return sql
 
+@lru_cache(maxsize=None)
 def load_mappings():
-    # Load your CSV/XLSX mapping files inside the container
+    # Load your CSV/XLSX mapping files inside the container, once, on first use
+    import pandas as pd
+
     siebel_mapping = pd.read_csv("siebel_mapping.csv")
     antillia_mapping = pd.read_csv("antillia_mapping.csv")
     return siebel_mapping, antillia_mapping
 
-# Load mappings once at startup
-SIEBEL_MAPPING, ANTILLIA_MAPPING = load_mappings()
-
 def predict(request):
     """
     Vertex AI custom prediction handler.
@@ -27,5 +27,6 @@ def predict(request):
     request_json = request.get_json(silent=True)
     prompt = request_json.get("prompt", "")
     
-    sql_query = generate_sql(prompt, SIEBEL_MAPPING, ANTILLIA_MAPPING)
+    siebel_mapping, antillia_mapping = load_mappings()
+    sql_query = generate_sql(prompt, siebel_mapping, antillia_mapping)
     return json.dumps({"sql_query": sql_query})
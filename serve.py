@@ -0,0 +1,25 @@
+"""
+Container entry point. Starts warm-up at boot, then runs Streamlit in this same
+process so app.py picks up the already-warming clients from the warmup module.
+
+Usage (any extra arguments are passed to `streamlit run app.py`):
+    python serve.py --server.port=8080
+"""
+import sys
+
+import warmup
+from settings import PROJECT_ID, REGION, BUCKET_NAME, CONTROL_MAPPING_FILE
+
+
+def main():
+    warmup.start(PROJECT_ID, REGION, BUCKET_NAME, CONTROL_MAPPING_FILE)
+
+    # Imported after start() so Streamlit's own import overlaps with warm-up
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", "app.py", *sys.argv[1:]]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+PROJECT_ID = "telecom-data-lake"
+REGION = "europe-west2"
+BUCKET_NAME = None
+CONTROL_MAPPING_FILE = "config/control_mapping.yaml"
+SYSTEM_CONNECTIONS_FILE = "config/system_connections.yaml"
@@ -1,17 +1,60 @@
 from bigquery_client import BigQueryAgent
 
-def fetch_system_data(project_id, systems):
-    """Fetch all system tables dynamically based on system list."""
-    bq = BigQueryAgent(project_id)
+# Columns fetched per table: everything documented in config/*_mapping.txt, in table
+# order. The controls read the ids, statuses, service numbers, product_name and amount
+# columns (accuracy picks the first matching amount column, so order matters); the
+# rest are kept for the Detailed Records view and CSV. Columns added to the tables
+# later are not fetched.
+SIEBEL_ACCOUNTS_COLUMNS = [
+    "account_id", "account_name", "account_type", "region", "created_date", "status",
+    "contact_email", "contact_phone",
+]
+SIEBEL_ASSETS_COLUMNS = [
+    "asset_id", "account_id", "asset_type", "installation_date", "asset_status", "location",
+    "maintenance_cost", "service_number", "asset_amount",
+]
+SIEBEL_ORDERS_COLUMNS = [
+    "order_id", "account_id", "asset_id", "order_date", "order_type", "quantity", "unit_price",
+    "order_status", "total_price",
+]
+BILLING_ACCOUNTS_COLUMNS = [
+    "billing_account_id", "account_id", "billing_address", "payment_method", "billing_cycle",
+    "currency", "status", "created_date", "service_number", "billing_amount",
+]
+BILLING_PRODUCTS_COLUMNS = [
+    "billing_product_id", "billing_account_id", "asset_id", "order_id", "product_name",
+    "charge_type", "charge_amount", "last_billed_date", "next_billing_date", "status",
+]
+
+def fetch_system_data(project_id, systems, client=None, product_name=None):
+    """
+    Fetch all system tables dynamically based on system list.
+    If product_name is given, billing_products is limited to that product, so the
+    controls only evaluate the selected product's billing records.
+    """
+    bq = BigQueryAgent(project_id, client=client)
     system_dfs = {}
+    product_filter = {"product_name": product_name} if product_name else None
 
     for system in systems:
         if system.lower() == "siebel":
-            system_dfs["siebel_accounts"] = bq.execute("SELECT * FROM `telecom-data-lake.o_siebel.siebel_accounts`")
-            system_dfs["siebel_assets"] = bq.execute("SELECT * FROM `telecom-data-lake.o_siebel.siebel_assets`")
-            system_dfs["siebel_orders"] = bq.execute("SELECT * FROM `telecom-data-lake.o_siebel.siebel_orders`")
+            system_dfs["siebel_accounts"] = bq.fetch_table(
+                "telecom-data-lake.o_siebel.siebel_accounts", columns=SIEBEL_ACCOUNTS_COLUMNS
+            )
+            system_dfs["siebel_assets"] = bq.fetch_table(
+                "telecom-data-lake.o_siebel.siebel_assets", columns=SIEBEL_ASSETS_COLUMNS
+            )
+            system_dfs["siebel_orders"] = bq.fetch_table(
+                "telecom-data-lake.o_siebel.siebel_orders", columns=SIEBEL_ORDERS_COLUMNS
+            )
         elif system.lower() == "antillia":
-            system_dfs["billing_accounts"] = bq.execute("SELECT * FROM `telecom-data-lake.gibantillia.billing_accounts`")
-            system_dfs["billing_products"] = bq.execute("SELECT * FROM `telecom-data-lake.gibantillia.billing_products`")
+            system_dfs["billing_accounts"] = bq.fetch_table(
+                "telecom-data-lake.gibantillia.billing_accounts", columns=BILLING_ACCOUNTS_COLUMNS
+            )
+            system_dfs["billing_products"] = bq.fetch_table(
+                "telecom-data-lake.gibantillia.billing_products",
+                columns=BILLING_PRODUCTS_COLUMNS,
+                filters=product_filter,
+            )
 
     return system_dfs
@@ -0,0 +1,43 @@
+import re
+from types import SimpleNamespace
+
+QUERY = re.compile(r"SELECT (?P<select>.+?) FROM `(?P<table>[^`]+)`(?: WHERE (?P<where>.+))?$")
+
+
+def stub_job_config(base=None, query_parameters=None, **properties):
+    return SimpleNamespace(base=base, query_parameters=query_parameters, **properties)
+
+
+class StubClient:
+    """
+    Stand-in for bigquery.Client that understands the SQL BigQueryAgent.plan() emits.
+    Dry runs report bytes from `sizes` ({"full"|"projected"|"pushdown": bytes}); real
+    runs evaluate the projection and WHERE clause against the in-memory `tables`.
+    """
+
+    def __init__(self, tables, sizes):
+        self.tables = tables
+        self.sizes = sizes
+        self.queries = []
+
+    def query(self, query, job_config=None):
+        self.queries.append((query, job_config))
+        match = QUERY.match(query)
+        if match["where"]:
+            strategy = "pushdown"
+        else:
+            strategy = "full" if match["select"] == "*" else "projected"
+        if getattr(job_config, "dry_run", False):
+            return SimpleNamespace(total_bytes_processed=self.sizes[strategy])
+
+        df = self.tables[match["table"]]
+        if match["where"]:
+            for column in re.findall(r"`(\w+)` = @\w+", match["where"]):
+                df = df[df[column] == job_config.query_parameters[column]]
+        if match["select"] != "*":
+            df = df[re.findall(r"`(\w+)`", match["select"])]
+        return SimpleNamespace(
+            result=lambda: SimpleNamespace(to_dataframe=lambda: df.reset_index(drop=True)),
+            total_bytes_billed=self.sizes[strategy],
+            cache_hit=False,
+        )
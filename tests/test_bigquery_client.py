@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+from bigquery_client import GIB, MIB, BigQueryAgent, QueryBudgetExceeded, make_job_config
+from bigquery_stub import StubClient, stub_job_config
+
+TABLE = "telecom-data-lake.gibantillia.billing_products"
+COLUMNS = ["asset_id", "product_name"]
+FILTERS = {"product_name": "Fiber Max"}
+
+ROWS = pd.DataFrame({
+    "asset_id": ["a1", "a2", "a3"],
+    "product_name": ["Fiber Max", "Mobile Pro", "Fiber Max"],
+    "charge_amount": [10.0, 20.0, 30.0],
+})
+
+
+def make_agent(full, projected, pushdown, **kwargs):
+    client = StubClient({TABLE: ROWS}, {"full": full, "projected": projected, "pushdown": pushdown})
+    return BigQueryAgent("test", client=client, job_config_factory=stub_job_config, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "sizes, expected",
+    [
+        # Equal scans: projected wins the tie, its cache entry is shared by every product
+        ((None, 50 * MIB, 50 * MIB), "projected"),
+        # Projected over its threshold
+        ((None, 20 * GIB, 20 * GIB), "pushdown"),
+        # Partition pruning makes pushdown cheaper even under the threshold
+        ((None, 2 * GIB, 1 * GIB), "pushdown"),
+    ],
+)
+def test_plan_picks_cheapest_strategy_within_threshold(sizes, expected):
+    agent = make_agent(*sizes)
+
+    assert agent.plan(TABLE, columns=COLUMNS, filters=FILTERS)["strategy"] == expected
+
+
+def test_plan_skips_select_star_when_columns_given():
+    agent = make_agent(None, 50 * MIB, 50 * MIB)
+
+    agent.plan(TABLE, columns=COLUMNS, filters=FILTERS)
+
+    assert len(agent.client.queries) == 2
+    assert not any(query.startswith("SELECT *") for query, _ in agent.client.queries)
+
+
+@pytest.mark.parametrize(
+    "sizes",
+    [(100 * MIB, 50 * MIB, 50 * MIB), (20 * GIB, 20 * GIB, 20 * GIB), (100 * MIB, 100 * MIB, 10 * MIB)],
+)
+@pytest.mark.parametrize("columns", [COLUMNS, ["asset_id"], None])
+def test_fetch_table_returns_same_rows_for_every_strategy(sizes, columns):
+    agent = make_agent(*sizes)
+
+    df = agent.fetch_table(TABLE, columns=columns, filters=FILTERS)
+
+    assert list(df.columns) == (columns or list(ROWS.columns))
+    assert df["asset_id"].tolist() == ["a1", "a3"]
+
+
+def test_fetch_table_over_budget_raises_before_running():
+    agent = make_agent(None, 70 * GIB, 60 * GIB)
+
+    with pytest.raises(QueryBudgetExceeded):
+        agent.fetch_table(TABLE, columns=COLUMNS, filters=FILTERS)
+    assert all(getattr(config, "dry_run", False) for _, config in agent.client.queries)
+
+
+def test_run_below_minimum_billing_raises_budget_error():
+    agent = make_agent(1 * MIB, 1 * MIB, 1 * MIB, run_byte_budget=5 * MIB)
+
+    with pytest.raises(QueryBudgetExceeded):
+        agent.fetch_table(TABLE)
+
+
+def test_run_charges_billed_bytes_and_caps_job():
+    agent = make_agent(100 * MIB, 50 * MIB, 50 * MIB, run_byte_budget=1 * GIB)
+
+    agent.fetch_table(TABLE)
+
+    _, config = agent.client.queries[-1]
+    assert config.maximum_bytes_billed == 1 * GIB
+    assert config.use_query_cache is True
+    assert agent.bytes_billed == 100 * MIB
+    assert agent.query_log[-1]["strategy"] == "full"
+
+
+def test_make_job_config_copies_callers_config():
+    bigquery = pytest.importorskip("google.cloud.bigquery")
+    base = bigquery.QueryJobConfig(default_dataset="telecom-data-lake.gibantillia", use_legacy_sql=False)
+
+    config = make_job_config(base, {"product_name": "Fiber Max"}, dry_run=True)
+
+    assert config.dry_run is True
+    assert str(config.default_dataset) == "telecom-data-lake.gibantillia"
+    assert config.use_legacy_sql is False
+    assert config.query_parameters[0].name == "product_name"
+    assert not base.dry_run
+    assert not base.query_parameters
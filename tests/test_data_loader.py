@@ -0,0 +1,81 @@
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from bigquery_client import MIB, BigQueryAgent
+from bigquery_stub import StubClient, stub_job_config
+from controls.completeness import run_completeness
+from systems import data_loader
+from systems.data_loader import fetch_system_data
+
+
+def table(columns, rows):
+    return pd.DataFrame([dict(zip(columns, row)) for row in rows], columns=columns)
+
+
+TABLES = {
+    "telecom-data-lake.o_siebel.siebel_accounts": table(
+        data_loader.SIEBEL_ACCOUNTS_COLUMNS,
+        [("acc1", "Acme", "SME", "London", "2024-01-01", "Active", "a@acme.test", "0100")],
+    ),
+    "telecom-data-lake.o_siebel.siebel_assets": table(
+        data_loader.SIEBEL_ASSETS_COLUMNS,
+        [
+            ("as1", "acc1", "Router", "2024-01-02", "Active", "Leeds", 10.0, "S1", 10.0),
+            ("as2", "acc1", "Router", "2024-01-02", "Active", "Leeds", 20.0, "S2", 20.0),
+        ],
+    ),
+    "telecom-data-lake.o_siebel.siebel_orders": table(
+        data_loader.SIEBEL_ORDERS_COLUMNS,
+        [
+            ("o1", "acc1", "as1", "2024-01-03", "New Installation", 1, 10.0, "Completed", 10.0),
+            ("o2", "acc1", "as2", "2024-01-03", "Upgrade", 1, 20.0, "Completed", 20.0),
+        ],
+    ),
+    "telecom-data-lake.gibantillia.billing_accounts": table(
+        data_loader.BILLING_ACCOUNTS_COLUMNS,
+        [("ba1", "acc1", "1 High St", "Direct Debit", "Monthly", "£", "Active", "2024-01-01", "S1", 10.0)],
+    ),
+    "telecom-data-lake.gibantillia.billing_products": table(
+        data_loader.BILLING_PRODUCTS_COLUMNS,
+        [
+            ("bp1", "ba1", "as1", "o1", "Fiber Max", "Monthly", 10.0, "2024-02-01", "2024-03-01", "Active"),
+            ("bp2", "ba1", "as2", "o2", "Mobile Pro", "Monthly", 20.0, "2024-02-01", "2024-03-01", "Active"),
+        ],
+    ),
+}
+
+
+@pytest.fixture(autouse=True)
+def stub_job_configs(monkeypatch):
+    monkeypatch.setattr(
+        data_loader, "BigQueryAgent", partial(BigQueryAgent, job_config_factory=stub_job_config)
+    )
+
+
+def fetch(product_name, sizes):
+    client = StubClient(TABLES, sizes)
+    return fetch_system_data("test", ["Siebel", "Antillia"], client=client, product_name=product_name)
+
+
+def test_detail_columns_survive_projection():
+    system_dfs = fetch("Fiber Max", {"projected": 50 * MIB, "pushdown": 50 * MIB})
+
+    merged, _ = run_completeness(system_dfs, "Fiber Max")
+
+    for column in ["account_name", "region", "order_date", "order_type", "charge_type"]:
+        assert column in merged.columns
+
+
+def test_controls_only_see_selected_product_for_every_strategy():
+    for sizes in [
+        {"projected": 50 * MIB, "pushdown": 50 * MIB},
+        {"projected": 100 * MIB, "pushdown": 10 * MIB},
+    ]:
+        system_dfs = fetch("Fiber Max", sizes)
+
+        merged, summary = run_completeness(system_dfs, "Fiber Max")
+
+        assert merged["product_name"].unique().tolist() == ["Fiber Max"]
+        assert summary.loc[summary["Metric"] == "Total Records", "Value"].item() == 1
@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+import warmup
+
+
+@pytest.fixture(autouse=True)
+def fresh_tasks(monkeypatch):
+    monkeypatch.setattr(warmup, "_tasks", {})
+
+
+def test_running_task_is_not_started_twice(monkeypatch):
+    monkeypatch.setattr(warmup, "WARMUP_TIMEOUT_SECONDS", 0.05)
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait()
+        return "client"
+
+    with pytest.raises(TimeoutError, match="'slow_client'"):
+        warmup._result("slow_client", slow)
+    with pytest.raises(TimeoutError):
+        warmup._result("slow_client", slow)
+    release.set()
+
+    assert warmup._submit("slow_client", slow).result(timeout=1) == "client"
+    assert len(calls) == 1
+
+
+def test_failed_task_is_retried():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("auth failed")
+        return "client"
+
+    with pytest.raises(RuntimeError):
+        warmup._result("flaky_client", flaky)
+
+    assert warmup._result("flaky_client", flaky) == "client"
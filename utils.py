@@ -1,9 +1,9 @@
 import yaml
-from google.cloud import storage
 
 def load_mapping(bucket_name: str, file_path: str) -> str:
     """Load mapping text file either from GCS or local."""
     if bucket_name:
+        from google.cloud import storage
         client = storage.Client()
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(file_path)
@@ -15,6 +15,7 @@ def load_mapping(bucket_name: str, file_path: str) -> str:
 def load_yaml_config(bucket_name, file_path):
     """Load YAML config from GCS or local filesystem."""
     if bucket_name:
+        from google.cloud import storage
         client = storage.Client()
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(file_path)
@@ -1,9 +1,11 @@
-from vertexai import init
-from vertexai.generative_models import GenerativeModel
 import time
 
 class VertexAgent:
     def __init__(self, project_id: str, region: str):
+        # Imported here so loading this module doesn't pull in the Vertex AI SDK
+        from vertexai import init
+        from vertexai.generative_models import GenerativeModel
+
         init(project=project_id, location=region)
         self.model = GenerativeModel("gemini-2.5-flash")
 
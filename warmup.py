@@ -0,0 +1,95 @@
+import importlib
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+# serve.py calls start() at container boot, and Streamlit then runs app.py in the
+# same process, so clients built here are shared across reruns and sessions.
+
+# Longest a caller waits for a warm-up task (e.g. one stuck in auth retries)
+WARMUP_TIMEOUT_SECONDS = 60
+
+# Heavy modules that the request path needs later; imported in the background.
+PRELOAD_MODULES = [
+    "pandas",
+    "controls.completeness",
+    "controls.accuracy",
+    "systems.data_loader",
+]
+
+_tasks = {}
+_lock = threading.Lock()
+
+
+def _run(future, fn, args):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(fn(*args))
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def _submit(name, fn, *args):
+    """
+    Run fn once per name on a daemon thread, so a hung task never blocks interpreter
+    exit. A failed task is started again on the next call; one still running is
+    never duplicated.
+    """
+    with _lock:
+        future = _tasks.get(name)
+        if future is None or (future.done() and future.exception() is not None):
+            future = Future()
+            _tasks[name] = future
+            threading.Thread(
+                target=_run, args=(future, fn, args), name=f"warmup-{name}", daemon=True
+            ).start()
+        return future
+
+
+def _result(name, fn, *args):
+    try:
+        return _submit(name, fn, *args).result(timeout=WARMUP_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        raise TimeoutError(
+            f"Warm-up task '{name}' did not finish within {WARMUP_TIMEOUT_SECONDS}s"
+        ) from None
+
+
+def _preload_modules():
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+
+
+def _build_vertex_agent(project_id, region):
+    from vertex_client import VertexAgent
+    return VertexAgent(project_id, region)
+
+
+def _build_bigquery_client(project_id):
+    from google.cloud import bigquery
+    return bigquery.Client(project=project_id)
+
+
+def _load_control_config(bucket_name, file_path):
+    from utils import load_yaml_config
+    return load_yaml_config(bucket_name, file_path)
+
+
+def start(project_id, region, bucket_name, control_mapping_file):
+    """Kick off all warm-up work without blocking the caller."""
+    _submit("modules", _preload_modules)
+    _submit("vertex_agent", _build_vertex_agent, project_id, region)
+    _submit("bigquery_client", _build_bigquery_client, project_id)
+    _submit("control_config", _load_control_config, bucket_name, control_mapping_file)
+
+
+def vertex_agent(project_id, region):
+    return _result("vertex_agent", _build_vertex_agent, project_id, region)
+
+
+def bigquery_client(project_id):
+    return _result("bigquery_client", _build_bigquery_client, project_id)
+
+
+def control_config(bucket_name, file_path):
+    return _result("control_config", _load_control_config, bucket_name, file_path)